@@ -1,15 +1,67 @@
+import hashlib
+import tempfile
+
 import pandas as pd
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog
 
+from parse_logic import clean_number_column
+
+# Use the Rust-based calamine reader when it's installed (much faster than
+# openpyxl on big exports); None lets pandas pick its default engine.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# The only Togal columns used downstream, with their target dtype.
+# Reading just these skips parsing / type inference on the rest.
+TOGAL_COLUMNS = {
+    "Classification Folder": "string",
+    "Classification": "string",
+    "Quantity 1": "float64",
+    "Quantity1 UOM": "string",
+    "Quantity 2": "float64",
+    "Quantity2 UOM": "string",
+    "Height": "float64",
+    "Height UOM": "string",
+    "Width": "float64",
+    "Width UOM": "string",
+    "Thickness": "float64",
+    "Thickness UOM": "string",
+    "Length": "float64",
+    "Length UOM": "string",
+    "Breakdown Tier": "string",
+    "Breakdown Item": "string",
+}
+
+# Only the text columns get a fixed dtype at read time: one stray text cell
+# in a numeric column would make read_excel fail the whole read. Numeric
+# columns are read as-is and coerced with pd.to_numeric(errors="coerce").
+_READ_DTYPES = {col: dtype for col, dtype in TOGAL_COLUMNS.items() if dtype == "string"}
+
+
+# One hidden Tk root shared by every file dialog (creating Tk() per dialog
+# spins up a whole new Tcl interpreter each time)
+_ROOT = None
+
+
+def get_hidden_root() -> tk.Tk:
+    """Return the shared hidden Tk root, creating it on first use."""
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()  # hide main tk window
+        _ROOT.attributes("-topmost", True)  # keep dialogs in front
+    return _ROOT
+
 
 def browse_for_file(title: str = "Select File") -> str:
     """Open a Windows file-browse dialog and return the selected path."""
-    root = tk.Tk()
-    root.withdraw()  # hide main tk window
-
     file_path = filedialog.askopenfilename(
+        parent=get_hidden_root(),
         title=title,
         filetypes=[
             ("Excel Files", "*.xlsx *.xlsm"),
@@ -17,33 +69,122 @@ def browse_for_file(title: str = "Select File") -> str:
         ]
     )
 
-    root.destroy()
     return file_path
 
 
-def load_togal_export(path_str: str) -> pd.DataFrame:
-    """Read a Togal export Excel file into a pandas DataFrame and print basic info."""
+def _read_togal_excel(path: Path) -> pd.DataFrame:
+    """
+    Read just the TOGAL_COLUMNS out of the export with pandas. Numeric
+    columns always come back as float64 (stray text -> NaN).
+    """
+    # Callable usecols: missing Togal columns are simply skipped, not an error
+    def is_togal_column(name) -> bool:
+        return name in TOGAL_COLUMNS
+
+    df = pd.read_excel(path, engine=EXCEL_ENGINE, usecols=is_togal_column, dtype=_READ_DTYPES)
+
+    for col, dtype in TOGAL_COLUMNS.items():
+        if dtype == "float64" and col in df.columns:
+            df[col] = clean_number_column(df[col])
+    return df
+
+
+def _cache_path(path: Path) -> Path:
+    """
+    Parquet sidecar location for this export: togal_<path key>_<version key>.
+    The version key changes whenever the file (mtime / size) or the columns
+    we read change; the path key lets us find older versions to prune.
+    """
+    stat = path.stat()
+    resolved = path.resolve()
+    path_key = hashlib.md5(str(resolved).encode()).hexdigest()
+    raw_key = f"{resolved}:{stat.st_mtime}:{stat.st_size}:{TOGAL_COLUMNS}"
+    key = hashlib.md5(raw_key.encode()).hexdigest()
+    return Path(tempfile.gettempdir()) / f"togal_{path_key}_{key}.parquet"
+
+
+def _prune_stale_caches(cache_path: Path) -> None:
+    """Delete older cache files for the same export (same path key)."""
+    path_key = cache_path.stem.split("_")[1]
+    for old in cache_path.parent.glob(f"togal_{path_key}_*.parquet"):
+        if old != cache_path:
+            try:
+                old.unlink(missing_ok=True)
+            except OSError:
+                pass  # e.g. locked by another process; try again next run
+
+
+def _cached_load(path: Path) -> pd.DataFrame:
+    """
+    Load the export from its Parquet cache if we've read this exact file
+    before; otherwise read the Excel file and write the cache (replacing
+    any cache left over from an older version of the same file).
+
+    Caching is best-effort: without a Parquet engine (pyarrow/fastparquet),
+    or if the data can't be stored as Parquet, we just read the Excel file.
+    """
+    cache_path = _cache_path(path)
+
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, ValueError):
+            pass  # unreadable cache: fall through and rebuild it
+
+    df = _read_togal_excel(path)
+
+    try:
+        df.to_parquet(cache_path, index=False)
+    except (ImportError, OSError, ValueError, TypeError):
+        try:
+            cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    else:
+        _prune_stale_caches(cache_path)
+
+    return df
+
+
+def load_togal_export(path_str: str, verbose: bool = False, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Read a Togal export Excel file into a pandas DataFrame.
+
+    With use_cache=True (default) the parsed columns are kept in a Parquet
+    file in the temp folder, so re-running on an unchanged export skips the
+    slow Excel parse.
+
+    With verbose=True also prints the columns and first 5 rows (formatting
+    the DataFrame preview is not free on big exports, so it is off by default).
+    """
     path = Path(path_str)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    print(f"\n=== Reading Togal export ===")
-    print(f"File: {path}")
+    if verbose:
+        print(f"\n=== Reading Togal export ===")
+        print(f"File: {path}")
 
-    df = pd.read_excel(path)
+    if use_cache:
+        df = _cached_load(path)
+    else:
+        df = _read_togal_excel(path)
 
-    print("\n=== Columns ===")
-    print(list(df.columns))
+    if verbose:
+        print("\n=== Columns ===")
+        print(list(df.columns))
 
-    print("\n=== First 5 rows ===")
-    print(df.head(5))
+        print("\n=== First 5 rows ===")
+        print(df.head(5))
 
-    # Quick sanity check on important columns
+    # Quick sanity check on important columns (warnings always print)
     key_cols = ["Classification Folder", "Classification"]
-    print("\n=== Column Check ===")
+    if verbose:
+        print("\n=== Column Check ===")
     for col in key_cols:
         if col in df.columns:
-            print(f"[OK] {col!r} found")
+            if verbose:
+                print(f"[OK] {col!r} found")
         else:
             print(f"[WARN] {col!r} not found!")
 
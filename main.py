@@ -1,15 +1,19 @@
 # main.py
 
-from loader import browse_for_file, load_togal_export
+from loader import browse_for_file, get_hidden_root, load_togal_export
 from parse_logic import parse_all_rows
-from pier_logic import build_pier_metrics, print_pier_metrics_summary
+from pier_logic import build_pier_metrics_from_df, print_pier_metrics_summary
 from pier_template_writer import write_piers_to_template
 
-import tkinter as tk
 from tkinter import filedialog
 from pathlib import Path
 
 
+# Print the DataFrame / parsed-row previews and per-cell write log.
+# Off by default: formatting those on big exports is slow and noisy.
+VERBOSE = False
+
+
 def main():
     # 1) Select the Togal export
     print("Select your Togal export (.xlsx) file...")
@@ -30,21 +34,22 @@ def main():
     # -------------------------------------------------------
     # Layer 0: Load Togal export into DataFrame
     # -------------------------------------------------------
-    df = load_togal_export(export_path)
+    df = load_togal_export(export_path, verbose=VERBOSE)
 
     # -------------------------------------------------------
-    # Layer 1: Parse DataFrame rows into ParsedRow objects
+    # Layer 1: ParsedRow preview (debug only -- Layer 2 reads the
+    #          DataFrame directly, so we only parse the first 5 rows)
     # -------------------------------------------------------
-    parsed_rows = parse_all_rows(df)
-
-    print("\n=== First 5 parsed rows (Python view of each Togal row) ===")
-    for pr in parsed_rows[:5]:
-        print(pr)
+    if VERBOSE:
+        print("\n=== First 5 parsed rows (Python view of each Togal row) ===")
+        for pr in parse_all_rows(df.head(5)):
+            print(pr)
 
     # -------------------------------------------------------
     # Layer 2: Build semantic drilled pier metrics
+    #          (vectorized straight off the DataFrame)
     # -------------------------------------------------------
-    pier_metrics = build_pier_metrics(parsed_rows)
+    pier_metrics = build_pier_metrics_from_df(df)
     print_pier_metrics_summary(pier_metrics)
 
     # -------------------------------------------------------
@@ -60,10 +65,8 @@ def main():
 
     print(f"\nSelect where to save the COMPLETED estimate ({default_ext})...")
 
-    root = tk.Tk()
-    root.withdraw()
-
     output_path = filedialog.asksaveasfilename(
+        parent=get_hidden_root(),
         title="Save completed estimate as...",
         defaultextension=default_ext,
         filetypes=[
@@ -73,8 +76,6 @@ def main():
         ],
     )
 
-    root.destroy()
-
     if not output_path:
         print("No output file selected; skipping template write.")
         return
@@ -86,6 +87,7 @@ def main():
         template_path=template_path,
         output_path=output_path,
         pier_metrics=pier_metrics,
+        verbose=VERBOSE,
     )
 
     print(f"\nWrote pier data into template: {output_path}")
@@ -1,12 +1,13 @@
 # parse_logic.py
 
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Iterable
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRow:
     """One Togal row, cleaned up into a Python-friendly structure."""
     folder: str
@@ -33,21 +34,68 @@ class ParsedRow:
     breakdown_tier: Optional[str]
     breakdown_item: Optional[str]
 
-def _get_number(row: pd.Series, col_name: str) -> Optional[float]:
+    # Derived, uppercased copies of the text fields the pier logic matches on
+    # ("" if blank), computed once in __post_init__ so Layer 2 doesn't
+    # re-normalize them per row. They are NOT kept in sync if you assign to
+    # folder / classification / *_uom afterwards -- build a new ParsedRow
+    # (or dataclasses.replace) instead of mutating those fields.
+    folder_u: str = field(init=False, repr=False, compare=False)
+    classification_u: str = field(init=False, repr=False, compare=False)
+    quantity1_uom_u: str = field(init=False, repr=False, compare=False)
+    height_uom_u: str = field(init=False, repr=False, compare=False)
+    width_uom_u: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for name, name_u in _UPPER_FIELD_PAIRS:
+            setattr(self, name_u, (getattr(self, name) or "").strip().upper())
+
+
+# ParsedRow field -> (Togal column, kind)
+_FIELD_COLUMNS = {
+    "folder": ("Classification Folder", "text"),
+    "classification": ("Classification", "text"),
+    "quantity1": ("Quantity 1", "number"),
+    "quantity1_uom": ("Quantity1 UOM", "text"),
+    "quantity2": ("Quantity 2", "number"),
+    "quantity2_uom": ("Quantity2 UOM", "text"),
+    "height": ("Height", "number"),
+    "height_uom": ("Height UOM", "text"),
+    "width": ("Width", "number"),
+    "width_uom": ("Width UOM", "text"),
+    "thickness": ("Thickness", "number"),
+    "thickness_uom": ("Thickness UOM", "text"),
+    "length": ("Length", "number"),
+    "length_uom": ("Length UOM", "text"),
+    "breakdown_tier": ("Breakdown Tier", "text"),
+    "breakdown_item": ("Breakdown Item", "text"),
+}
+
+# Fields that are "" instead of None when blank
+_EMPTY_STRING_FIELDS = ("folder", "classification")
+
+# Fields that get a cached uppercase "<name>_u" copy, as (name, name_u) pairs
+_UPPER_FIELDS = ("folder", "classification", "quantity1_uom", "height_uom", "width_uom")
+_UPPER_FIELD_PAIRS = tuple((name, name + "_u") for name in _UPPER_FIELDS)
+
+# ParsedRow's positional __init__ argument order, taken from the dataclass itself
+_PARSED_ROW_FIELDS = tuple(f.name for f in fields(ParsedRow) if f.init)
+
+
+def _get_number(value) -> Optional[float]:
     """Return a float if the cell is numeric, otherwise None."""
-    if col_name not in row or pd.isna(row[col_name]):
+    if pd.isna(value):
         return None
     try:
-        return float(row[col_name])
+        return float(value)
     except (TypeError, ValueError):
         return None
 
 
-def _get_text(row: pd.Series, col_name: str) -> Optional[str]:
+def _get_text(value) -> Optional[str]:
     """Return a stripped string if present, otherwise None."""
-    if col_name not in row or pd.isna(row[col_name]):
+    if pd.isna(value):
         return None
-    text = str(row[col_name]).strip()
+    text = str(value).strip()
     return text if text else None
 
 
@@ -55,59 +103,91 @@ def parse_row(row: pd.Series) -> ParsedRow:
     """
     Take a single pandas row from the Togal export and turn it into a ParsedRow
     that matches how you look at the row as a human.
+
+    Single-row debug helper; the pipeline itself uses the vectorized
+    parse_all_rows / clean_togal_frame path.
     """
+    values = {}
+    for field_name, (col_name, kind) in _FIELD_COLUMNS.items():
+        raw = row.get(col_name)
+        value = _get_number(raw) if kind == "number" else _get_text(raw)
+        if field_name in _EMPTY_STRING_FIELDS:
+            value = value or ""
+        values[field_name] = value
+    return ParsedRow(**values)
+
 
-    folder = _get_text(row, "Classification Folder") or ""
-    classification = _get_text(row, "Classification") or ""
+def clean_number_column(series: pd.Series) -> pd.Series:
+    """Column-wise _get_number: float64, with NaN for blanks / non-numeric cells."""
+    return pd.to_numeric(series, errors="coerce").astype("float64")
 
-    quantity1 = _get_number(row, "Quantity 1")
-    quantity1_uom = _get_text(row, "Quantity1 UOM")
 
-    quantity2 = _get_number(row, "Quantity 2")
-    quantity2_uom = _get_text(row, "Quantity2 UOM")
+def _clean_text_column(series: pd.Series) -> pd.Series:
+    """Column-wise _get_text: stripped strings, with <NA> for blanks."""
+    text = series.astype("string").str.strip()
+    return text.mask(text == "")
 
-    height = _get_number(row, "Height")
-    height_uom = _get_text(row, "Height UOM")
 
-    width = _get_number(row, "Width")
-    width_uom = _get_text(row, "Width UOM")
+def clean_togal_frame(df: pd.DataFrame, only: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Clean every Togal column we care about (or just the ParsedRow fields
+    named in `only`) in one vectorized pass.
 
-    thickness = _get_number(row, "Thickness")
-    thickness_uom = _get_text(row, "Thickness UOM")
+    Returns a DataFrame with one column per ParsedRow field (same index as df):
+    numbers are float64 with NaN for blanks, text is stripped 'string' dtype
+    with <NA> for blanks. folder / classification use "" instead of <NA>,
+    and missing Togal columns come back all-blank.
+    """
+    cleaned: Dict[str, pd.Series] = {}
+    wanted = _FIELD_COLUMNS.keys() if only is None else only
 
-    length = _get_number(row, "Length")
-    length_uom = _get_text(row, "Length UOM")
+    for field_name in wanted:
+        col_name, kind = _FIELD_COLUMNS[field_name]
+        if col_name in df.columns:
+            source = df[col_name]
+        else:
+            source = pd.Series(None, index=df.index, dtype="object")
 
-    breakdown_tier = _get_text(row, "Breakdown Tier")
-    breakdown_item = _get_text(row, "Breakdown Item")
+        if kind == "number":
+            values = clean_number_column(source)
+        else:
+            values = _clean_text_column(source)
 
-    return ParsedRow(
-        folder=folder,
-        classification=classification,
-        quantity1=quantity1,
-        quantity1_uom=quantity1_uom,
-        quantity2=quantity2,
-        quantity2_uom=quantity2_uom,
-        height=height,
-        height_uom=height_uom,
-        width=width,
-        width_uom=width_uom,
-        thickness=thickness,
-        thickness_uom=thickness_uom,
-        length=length,
-        length_uom=length_uom,
-        breakdown_tier=breakdown_tier,
-        breakdown_item=breakdown_item,
-    )
+        if field_name in _EMPTY_STRING_FIELDS:
+            values = values.fillna("")
+
+        cleaned[field_name] = values
+
+    return pd.DataFrame(cleaned, index=df.index)
+
+
+def _prepare_columns(df: pd.DataFrame) -> Dict[str, list]:
+    """
+    Return {ParsedRow field name: list of cleaned Python values} for df,
+    with None wherever clean_togal_frame has NaN / <NA>.
+    """
+    cleaned = clean_togal_frame(df)
+    prepared: Dict[str, list] = {}
+
+    for field_name, (_, kind) in _FIELD_COLUMNS.items():
+        if kind == "number":
+            arr = cleaned[field_name].to_numpy(dtype=float)
+            prepared[field_name] = np.where(np.isnan(arr), None, arr).tolist()
+        else:
+            prepared[field_name] = cleaned[field_name].to_numpy(dtype=object, na_value=None).tolist()
+
+    return prepared
 
 
 def parse_all_rows(df: pd.DataFrame) -> List[ParsedRow]:
     """
-    Walk the entire Togal DataFrame row-by-row and return a list of ParsedRow
-    objects. This mirrors how you normally work: one row at a time.
+    Turn the entire Togal DataFrame into a list of ParsedRow objects.
+
+    Cleaning is done column-by-column with pandas (see clean_togal_frame), so
+    the only per-row Python work left is building the ParsedRow itself.
     """
-    parsed: List[ParsedRow] = []
-    for _, row in df.iterrows():
-        parsed_row = parse_row(row)
-        parsed.append(parsed_row)
-    return parsed
+    prepared = _prepare_columns(df)
+    # Order comes from ParsedRow's own fields, so the positional zip below
+    # can't drift out of sync with the dataclass
+    cols_in_order = [prepared[field_name] for field_name in _PARSED_ROW_FIELDS]
+    return [ParsedRow(*vals) for vals in zip(*cols_in_order)]
@@ -3,10 +3,13 @@
 from dataclasses import dataclass
 from typing import Dict, Tuple, List, Optional
 
-from parse_logic import ParsedRow
+import numpy as np
+import pandas as pd
 
+from parse_logic import ParsedRow, clean_togal_frame
 
-@dataclass
+
+@dataclass(slots=True)
 class PierMetrics:
     """
     Semantic representation of a drilled pier condition,
@@ -24,6 +27,34 @@ class PierMetrics:
     breakdown_item: Optional[str] = None
 
 
+@dataclass(slots=True)
+class _PierAcc:
+    """Running totals for one (tier, classification) in build_pier_metrics."""
+    shaft_dia_in: Optional[float] = None
+    bell_dia_in: Optional[float] = None
+    depth_ft: Optional[float] = None
+    count: float = 0.0
+    breakdown_item: Optional[str] = None
+
+
+# Accepted UOM spellings (compared after strip + upper)
+_UOM_IN = frozenset({"IN", "INCH", "INCHES"})
+_UOM_FT = frozenset({"FT", "FEET", "FOOT"})
+_UOM_EA = frozenset({"EA", "EACH", "COUNT", "#"})
+
+# Small integer UOM codes used by build_pier_metrics_from_df
+_UOM_CODE_IN = 0
+_UOM_CODE_FT = 1
+_UOM_CODE_EA = 2
+_UOM_CODE_OTHER = 3
+_UOM_CODE_BLANK = 4
+_UOM_CODES = {
+    **dict.fromkeys(_UOM_IN, _UOM_CODE_IN),
+    **dict.fromkeys(_UOM_FT, _UOM_CODE_FT),
+    **dict.fromkeys(_UOM_EA, _UOM_CODE_EA),
+}
+
+
 # ---------- helpers ----------
 
 def _normalize(text: Optional[str]) -> str:
@@ -55,16 +86,14 @@ def is_pier_row(row: ParsedRow) -> bool:
     """
     Decide if a ParsedRow represents a *drilled pier* (not pier caps).
     """
-    name = _normalize_upper(row.classification)
-    folder = _normalize_upper(row.folder)
-
     # 1) True drilled piers: classification starts with "PIER"
     #    e.g. "PIER - 1", "PIER - 2"
-    if name.startswith("PIER"):
+    if row.classification_u.startswith("PIER"):
         return True
 
     # 2) Fallback: folder explicitly says something like "DRILLED PIER TAKEOFF"
     #    but avoid generic "Pier Caps" etc.
+    folder = row.folder_u
     if "DRILLED" in folder and "PIER" in folder:
         return True
 
@@ -72,10 +101,26 @@ def is_pier_row(row: ParsedRow) -> bool:
     return False
 
 
+def pier_row_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized is_pier_row over a raw Togal DataFrame: boolean array,
+    True for drilled pier rows. Only cleans Classification + Folder.
+    """
+    keys = clean_togal_frame(df, only=("classification", "folder"))
+    name = keys["classification"].str.upper()
+    folder = keys["folder"].str.upper()
+
+    mask = name.str.startswith("PIER") | (
+        folder.str.contains("DRILLED", regex=False)
+        & folder.str.contains("PIER", regex=False)
+    )
+    return mask.to_numpy(dtype=bool)
+
+
 # ---------- core layer-2 logic ----------
 
 def build_pier_metrics(rows: List[ParsedRow]) -> Dict[Tuple[str, str], PierMetrics]:
-    acc: Dict[Tuple[str, str], Dict[str, Optional[float]]] = {}
+    acc: Dict[Tuple[str, str], _PierAcc] = {}
 
     for r in rows:
         if not is_pier_row(r):
@@ -85,30 +130,23 @@ def build_pier_metrics(rows: List[ParsedRow]) -> Dict[Tuple[str, str], PierMetri
         cls = _normalize(r.classification)
         key = (tier, cls)
 
-        if key not in acc:
-            acc[key] = {
-                "shaft_dia_in": None,
-                "bell_dia_in": None,
-                "depth_ft": None,
-                "count": 0.0,
-                "breakdown_item": None,      # <-- NEW
-            }
-
-        m = acc[key]
+        m = acc.get(key)
+        if m is None:
+            m = acc[key] = _PierAcc()
 
         # NEW: capture breakdown item text once per (tier, classification)
         item = _normalize(r.breakdown_item)
-        if item and not m["breakdown_item"]:
-            m["breakdown_item"] = item
+        if item and not m.breakdown_item:
+            m.breakdown_item = item
 
         # --- Shaft diameter from Width (+ UOM) ---
         if r.width is not None and r.width_uom:
-            uom = _normalize_upper(r.width_uom)
+            uom = r.width_uom_u
 
-            if uom in ("IN", "INCH", "INCHES"):
+            if uom in _UOM_IN:
                 shaft = r.width
 
-            elif uom in ("FT", "FEET", "FOOT"):
+            elif uom in _UOM_FT:
                 # Convert exactly — no rounding here
                 shaft = _ft_to_in(r.width)
 
@@ -116,53 +154,174 @@ def build_pier_metrics(rows: List[ParsedRow]) -> Dict[Tuple[str, str], PierMetri
                 shaft = None
 
             if shaft is not None:
-                m["shaft_dia_in"] = shaft
+                m.shaft_dia_in = shaft
 
                 # Bell = shaft if nothing else provided
-                if m["bell_dia_in"] is None:
-                    m["bell_dia_in"] = shaft
+                if m.bell_dia_in is None:
+                    m.bell_dia_in = shaft
 
         # --- Depth from Height ---
         if r.height is not None and r.height_uom:
-            uom = _normalize_upper(r.height_uom)
+            uom = r.height_uom_u
 
-            if uom in ("FT", "FEET", "FOOT"):
+            if uom in _UOM_FT:
                 depth_ft = r.height
-            elif uom in ("IN", "INCH", "INCHES"):
+            elif uom in _UOM_IN:
                 depth_ft = r.height / 12.0
             else:
                 depth_ft = None
 
             if depth_ft is not None:
-                m["depth_ft"] = depth_ft
+                m.depth_ft = depth_ft
 
         # --- Count (EA) ---
         if r.quantity1 is not None:
             if not r.quantity1_uom:
-                m["count"] += r.quantity1
+                m.count += r.quantity1
             else:
-                q_uom = _normalize_upper(r.quantity1_uom)
-                if q_uom in ("EA", "EACH", "COUNT", "#"):
-                    m["count"] += r.quantity1
+                q_uom = r.quantity1_uom_u
+                if q_uom in _UOM_EA:
+                    m.count += r.quantity1
 
     # Final conversion into PierMetrics objects
     result: Dict[Tuple[str, str], PierMetrics] = {}
 
     for (tier, cls), m in acc.items():
-        depth_ft = m["depth_ft"]
-        count = m["count"]
+        depth_ft = m.depth_ft
+        count = m.count
 
         total_length = depth_ft * count if depth_ft is not None else None
 
         result[(tier, cls)] = PierMetrics(
             tier=tier,
             classification=cls,
-            shaft_dia_in=m["shaft_dia_in"],
-            bell_dia_in=m["bell_dia_in"],
+            shaft_dia_in=m.shaft_dia_in,
+            bell_dia_in=m.bell_dia_in,
             depth_ft=depth_ft,
             count=count,
             total_length_lf=total_length,
-            breakdown_item=m["breakdown_item"],
+            breakdown_item=m.breakdown_item,
+        )
+
+    return result
+
+
+def _normalize_tier_series(tiers: pd.Series) -> pd.Series:
+    """
+    Vectorized _normalize_tier for a cleaned (already stripped) tier column.
+    """
+    t = tiers.fillna("").str.upper()
+    spaced = (
+        t.str.replace("TIER", "TIER ", regex=False)
+        .str.replace("  ", " ", regex=False)
+        .str.strip()
+    )
+    t = t.where(~t.str.startswith("TIER"), spaced)
+    return t.mask(t == "", "UNASSIGNED")
+
+
+def _none_if_nan(value) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
+
+
+def _uom_codes(uoms: pd.Series) -> np.ndarray:
+    """Map a cleaned UOM column to _UOM_CODE_* values (int8)."""
+    codes = uoms.str.upper().map(_UOM_CODES).fillna(_UOM_CODE_OTHER)
+    codes = codes.mask(uoms.isna(), _UOM_CODE_BLANK)
+    return codes.to_numpy(dtype=np.int8)
+
+
+def _first_valid(values: np.ndarray, valid: np.ndarray, group_id: np.ndarray, n_groups: int, fill):
+    """Per group, the first values[i] (in row order) where valid[i] is True."""
+    out = np.full(n_groups, fill, dtype=values.dtype)
+    groups, first = np.unique(group_id[valid], return_index=True)
+    out[groups] = values[valid][first]
+    return out
+
+
+def _last_valid(values: np.ndarray, valid: np.ndarray, group_id: np.ndarray, n_groups: int, fill):
+    """Per group, the last values[i] (in row order) where valid[i] is True."""
+    return _first_valid(values[::-1], valid[::-1], group_id[::-1], n_groups, fill)
+
+
+def _accumulate(width, width_uom, height, height_uom, qty, qty_uom, group_id, n_groups):
+    """
+    Array version of the build_pier_metrics accumulation loop.
+
+    Takes the raw Width / Height / Quantity 1 values (in whatever unit their
+    UOM code says) and a group id per row; returns (shaft_dia_in,
+    bell_dia_in, depth_ft, count) arrays with one entry per group (NaN where
+    a group had no valid value).
+    """
+    # Shaft diameter in inches: last valid wins, bell = first valid
+    shaft = np.where(
+        width_uom == _UOM_CODE_IN,
+        width,
+        np.where(width_uom == _UOM_CODE_FT, width * 12.0, np.nan),
+    )
+    has_shaft = ~np.isnan(shaft)
+    shaft_out = _last_valid(shaft, has_shaft, group_id, n_groups, np.nan)
+    bell_out = _first_valid(shaft, has_shaft, group_id, n_groups, np.nan)
+
+    # Depth in feet: last valid wins
+    depth = np.where(
+        height_uom == _UOM_CODE_FT,
+        height,
+        np.where(height_uom == _UOM_CODE_IN, height / 12.0, np.nan),
+    )
+    depth_out = _last_valid(depth, ~np.isnan(depth), group_id, n_groups, np.nan)
+
+    # Count (EA): blank UOM counts too. bincount sums in row order, like the loop.
+    counts_as_ea = (qty_uom == _UOM_CODE_EA) | (qty_uom == _UOM_CODE_BLANK)
+    count = np.where(counts_as_ea & ~np.isnan(qty), qty, 0.0)
+    count_out = np.bincount(group_id, weights=count, minlength=n_groups)
+
+    return shaft_out, bell_out, depth_out, count_out
+
+
+def build_pier_metrics_from_df(df: pd.DataFrame) -> Dict[Tuple[str, str], PierMetrics]:
+    """
+    Same result as build_pier_metrics(parse_all_rows(df)), but computed on
+    NumPy arrays: rows get an integer group id per (tier, classification)
+    via factorize, then _accumulate reduces each column per group.
+    """
+    # Find the drilled pier rows first, then fully clean only those
+    rows = clean_togal_frame(df[pier_row_mask(df)])
+
+    tiers = _normalize_tier_series(rows["breakdown_tier"]).to_numpy(dtype=object)
+    classes = rows["classification"].to_numpy(dtype=object)
+    group_id, groups = pd.MultiIndex.from_arrays([tiers, classes]).factorize()
+    n_groups = len(groups)
+
+    shaft_out, bell_out, depth_out, count_out = _accumulate(
+        rows["width"].to_numpy(dtype=float),
+        _uom_codes(rows["width_uom"]),
+        rows["height"].to_numpy(dtype=float),
+        _uom_codes(rows["height_uom"]),
+        rows["quantity1"].to_numpy(dtype=float),
+        _uom_codes(rows["quantity1_uom"]),
+        group_id,
+        n_groups,
+    )
+
+    items = rows["breakdown_item"].to_numpy(dtype=object, na_value=None)
+    item_out = _first_valid(items, pd.notna(items), group_id, n_groups, None)
+
+    result: Dict[Tuple[str, str], PierMetrics] = {}
+
+    for g, (tier, cls) in enumerate(groups):
+        depth_ft = _none_if_nan(depth_out[g])
+        count = float(count_out[g])
+
+        result[(tier, cls)] = PierMetrics(
+            tier=tier,
+            classification=cls,
+            shaft_dia_in=_none_if_nan(shaft_out[g]),
+            bell_dia_in=_none_if_nan(bell_out[g]),
+            depth_ft=depth_ft,
+            count=count,
+            total_length_lf=depth_ft * count if depth_ft is not None else None,
+            breakdown_item=item_out[g],
         )
 
     return result
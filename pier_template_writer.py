@@ -1,9 +1,12 @@
 # pier_template_writer.py
 
+import re
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Dict, Tuple
 
 from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
 from pier_logic import PierMetrics
 from openpyxl.worksheet.datavalidation import DataValidation
 
@@ -27,28 +30,57 @@ ROW_LABELS = {
     "total_length_lf": ["TOTAL LENGTH LF PIERS", "TOTAL LENGTH", "TOTAL LF"],
 }
 
+# One precompiled "KW1|KW2|..." pattern per field, matched against the
+# uppercased column-A text
+LABEL_REGEX = {
+    field: re.compile("|".join(re.escape(kw) for kw in keywords))
+    for field, keywords in ROW_LABELS.items()
+    if keywords
+}
+
 # Row where we store the breakdown item name for the pier section
 PIER_BREAKDOWN_ROW = 77
 
+# Pier condition names go in this row, one column per condition from column C
+PIER_HEADER_ROW = 5
+PIER_START_COL = 3
+
+
+def _column_a_upper(sheet):
+    """
+    Snapshot column A as a list of uppercase strings ("" for blank cells).
+    List position i holds row i + 1.
+    """
+    return [
+        str(val).upper() if val else ""
+        for (val,) in sheet.iter_rows(min_row=1, max_row=sheet.max_row, max_col=1, values_only=True)
+    ]
+
 
-def _find_row(sheet, keywords):
+def _find_row(col_a, regex):
     """
-    Search column A for the first row whose text contains ANY keyword
-    (case-insensitive). Returns the row index or None.
+    Search a column-A snapshot (see _column_a_upper) for the first row whose
+    text matches regex (one of LABEL_REGEX). Returns the row index or None.
     """
-    if not keywords:
+    if regex is None:
         return None
 
-    for r in range(1, sheet.max_row + 1):
-        val = sheet.cell(row=r, column=1).value
-        if not val:
-            continue
+    return next((i + 1 for i, text in enumerate(col_a) if regex.search(text)), None)
+
 
-        text = str(val).upper()
-        for kw in keywords:
-            if kw in text:
-                return r
-    return None
+def _index_label_rows(sheet):
+    """
+    Return {field: row index} for every field in ROW_LABELS, using a single
+    read of column A. Fields whose label is not found are left out.
+    """
+    col_a = _column_a_upper(sheet)
+
+    label_rows = {}
+    for field in ROW_LABELS:
+        row = _find_row(col_a, LABEL_REGEX.get(field))
+        if row:
+            label_rows[field] = row
+    return label_rows
 
 
 def _make_safe_sheet_title(tier_name: str) -> str:
@@ -141,6 +173,7 @@ def write_piers_to_template(
     template_path: str,
     output_path: str,
     pier_metrics: Dict[Tuple[str, str], PierMetrics],
+    verbose: bool = False,
 ):
     """
     Layer 3: write drilled pier metrics into the estimating template.
@@ -153,9 +186,12 @@ def write_piers_to_template(
         - writes pier condition names into row 5 starting at column C
         - writes shaft, bell, depth, and count into the appropriate rows
     - DOES NOT overwrite rows that hold formulas like 'Total Length LF Piers'
+    - Per-cell progress is only printed with verbose=True ([WARN] lines
+      always print)
     """
-    print("\n=== Layer 3: Writing Pier Data into Template ===")
-    print(f"Loading template: {template_path}")
+    if verbose:
+        print("\n=== Layer 3: Writing Pier Data into Template ===")
+        print(f"Loading template: {template_path}")
 
     template_suffix = Path(template_path).suffix.lower()
     output_suffix = Path(output_path).suffix.lower()
@@ -165,10 +201,12 @@ def write_piers_to_template(
     keep_vba = template_suffix == ".xlsm" and output_suffix == ".xlsm"
 
     if keep_vba:
-        print("Loading workbook with VBA preservation (keep_vba=True).")
+        if verbose:
+            print("Loading workbook with VBA preservation (keep_vba=True).")
         wb = load_workbook(template_path, data_only=False, keep_vba=True)
     else:
-        print("Loading workbook without VBA preservation (keep_vba=False).")
+        if verbose:
+            print("Loading workbook without VBA preservation (keep_vba=False).")
         wb = load_workbook(template_path, data_only=False)
 
     # Collect unique tiers from the metrics (e.g., 'TIER 1', 'TIER 2', 'UNASSIGNED')
@@ -179,7 +217,12 @@ def write_piers_to_template(
         print(f"Saved (unchanged) template as: {output_path}")
         return
 
-    print(f"Detected tiers: {tiers}")
+    if verbose:
+        print(f"Detected tiers: {tiers}")
+
+    # Every tier sheet is a copy of BID, so the label -> row map is the same
+    # for all of them: find it once on BID before cloning.
+    label_rows = _index_label_rows(_get_template_sheet(wb))
 
     # Create one cloned BID-style sheet per tier
     tier_to_sheet = _create_tier_sheets(wb, tiers)
@@ -196,26 +239,30 @@ def write_piers_to_template(
     # Write each tier sheet
     for tier, metrics_list in tier_buckets.items():
         sheet = tier_to_sheet[tier]
-        print(f"\n--- Writing Tier: {tier} into sheet '{sheet.title}' ---")
+        if verbose:
+            print(f"\n--- Writing Tier: {tier} into sheet '{sheet.title}' ---")
 
         if not metrics_list:
-            print("  No drilled piers for this tier.")
+            if verbose:
+                print("  No drilled piers for this tier.")
             continue
 
         # Sort conditions by classification so columns are in a stable order
-        metrics_list.sort(key=lambda m: m.classification)
+        metrics_list.sort(key=attrgetter("classification"))
 
-        start_col = 3  # column C
-        header_row = 5
+        # Collect (row, col, value) for the whole sheet first, then write them
+        # in row/column order in one pass
+        writes = []
 
         for idx, metrics in enumerate(metrics_list):
-            col = start_col + idx
+            col = PIER_START_COL + idx
+            col_letter = get_column_letter(col)
 
             # Header: "PIER - 1", "PIER - 2", etc.
-            header_cell = sheet.cell(row=header_row, column=col)
-            header_cell.value = metrics.classification
+            writes.append((PIER_HEADER_ROW, col, metrics.classification))
 
-            print(f"  Condition '{metrics.classification}' → column {col} ({header_cell.coordinate})")
+            if verbose:
+                print(f"  Condition '{metrics.classification}' → column {col} ({col_letter}{PIER_HEADER_ROW})")
 
             # Map metric names → values
             field_map = {
@@ -231,21 +278,26 @@ def write_piers_to_template(
                 if value is None:
                     continue
 
-                keywords = ROW_LABELS.get(field, [])
-                row = _find_row(sheet, keywords)
+                row = label_rows.get(field)
                 if not row:
+                    keywords = ROW_LABELS.get(field, [])
                     print(f"    [WARN] Could not find row for {field} (keywords={keywords})")
                     continue
 
-                cell = sheet.cell(row=row, column=col)
-                cell.value = value
-                print(f"    Wrote {field} = {value} → {cell.coordinate}")
+                writes.append((row, col, value))
+                if verbose:
+                    print(f"    Wrote {field} = {value} → {col_letter}{row}")
 
             label = metrics.breakdown_item or metrics.tier
             if label:
-                label_cell = sheet.cell(row=PIER_BREAKDOWN_ROW, column=col)
-                label_cell.value = label
-                print(f"    Wrote breakdown label '{label}' → {label_cell.coordinate}")
+                writes.append((PIER_BREAKDOWN_ROW, col, label))
+                if verbose:
+                    print(f"    Wrote breakdown label '{label}' → {col_letter}{PIER_BREAKDOWN_ROW}")
+
+        writes.sort(key=itemgetter(0, 1))
+        for row, col, value in writes:
+            sheet.cell(row=row, column=col, value=value)
 
     wb.save(output_path)
-    print(f"\nSaved completed estimate: {output_path}\n")
+    if verbose:
+        print(f"\nSaved completed estimate: {output_path}\n")